@@ -1,14 +1,18 @@
 import streamlit as st
 import pandas as pd
-import json
-import time
+import io
+import orjson
+from datetime import datetime
+from typing import Optional
+from concurrent.futures.process import BrokenProcessPool
 from components.text_extractor import TextExtractor
-from components.ai_analyzer import JobMatchingAIAnalyzer
 from components.visualizer import Visualizer
 from components.auth import AuthManager
 from components.login import LoginPage
 from components.branding import FCGBranding
-from utils.helpers import SessionManager, FileValidator, ConfigManager, format_score_color
+from components.batch_processor import create_executor, run_batch
+from utils.helpers import SessionManager, FileValidator, ConfigManager, format_score_color, content_digest
+from utils.text_cache import text_cache
 
 favicon = "../assets/fcg_logo.png"
 
@@ -20,25 +24,79 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Authentication and configuration are set up once per process, not on every rerun
+@st.cache_resource
+def get_auth_manager():
+    """Create the authentication manager"""
+    return AuthManager()
+
+@st.cache_resource
+def get_login_page():
+    """Create the login page, sharing the cached authentication manager"""
+    return LoginPage(get_auth_manager())
+
+@st.cache_data(show_spinner=False)
+def get_config():
+    """Load the application configuration"""
+    return ConfigManager.load_config()
+
 # Initialize authentication and login components
-auth_manager = AuthManager()
-login_page = LoginPage()
+auth_manager = get_auth_manager()
+login_page = get_login_page()
 
 # Initialize session state
 SessionManager.init_session_state()
 
 # Load configuration
-config = ConfigManager.load_config()
+config = get_config()
 
-# Initialize components
+# Components are created lazily, on the first code path that needs them
 @st.cache_resource
-def init_components():
-    """Initialize AI components with caching"""
-    return {
-        'extractor': TextExtractor(),
-        'analyzer': JobMatchingAIAnalyzer(), 
-        'visualizer': Visualizer()
-    }
+def get_analyzer():
+    """Load the AI analyzer (spaCy model, skills database) once per process"""
+    from components.ai_analyzer import JobMatchingAIAnalyzer
+    return JobMatchingAIAnalyzer()
+
+@st.cache_resource
+def get_visualizer():
+    """Create the visualizer once per process"""
+    return Visualizer()
+
+@st.cache_resource
+def get_batch_executor():
+    """Process pool shared across reruns so workers keep their loaded analyzers"""
+    return create_executor()
+
+def extract_text_cached(digest: str, file_type: str, data: bytes) -> Optional[str]:
+    """Extract resume text through the shared content-addressed text cache"""
+    return text_cache.get_or_extract(digest, lambda: TextExtractor.extract_text(data, file_type))
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def score_resume_cached(digest: str, job_description_digest: str, job_title: str,
+                        _text: str, _job_description: str) -> dict:
+    """Score resume text, cached on the file and job description digests"""
+    return get_analyzer().calculate_resume_score(_text, _job_description, job_title)
+
+# Figures are cached on their input data, so reruns reuse already-built charts
+@st.cache_data(max_entries=64, show_spinner=False)
+def score_gauge_figure(score: float):
+    """Build the overall score gauge"""
+    return get_visualizer().create_score_gauge(score)
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def scores_radar_figure(scores: dict):
+    """Build the detailed scores radar chart"""
+    return get_visualizer().create_detailed_scores_radar(scores)
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def skills_bar_figure(skills_data: dict):
+    """Build the skills by category bar chart"""
+    return get_visualizer().create_skills_bar_chart(skills_data)
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def skills_wordcloud_figure(skills_data: dict):
+    """Render the skills word cloud"""
+    return get_visualizer().create_skills_wordcloud(skills_data)
 
 def check_authentication():
     """Check if user is authenticated"""
@@ -74,9 +132,6 @@ def main():
 def show_main_application():
     """Show the main application interface"""
     
-    # Initialize components
-    components = init_components()
-    
     # Inject FCG branding
     FCGBranding.inject_fcg_css()
     
@@ -112,7 +167,7 @@ def show_main_application():
         # User management for admins
         if user_data.get('role') == 'admin':
             with st.expander("👥 User Management"):
-                login_page.show_user_management()
+                render_user_management()
         
         # Job description input
         job_description = st.text_area(
@@ -127,22 +182,43 @@ def show_main_application():
         batch_mode = st.checkbox("Batch Processing Mode", help="Analyze multiple resumes at once")
         
         # Analysis history
-        if st.session_state.analysis_history:
-            st.header("📊 Recent Analyses")
-            for i, history_item in enumerate(reversed(st.session_state.analysis_history[-5:])):
-                with st.expander(f"{history_item['filename']} - Score: {history_item['analysis']['overall_score']:.1f}"):
-                    st.write(f"**Timestamp:** {history_item['timestamp']}")
-                    st.write(f"**Skills Found:** {history_item['analysis']['total_skills_count']}")
-                    st.write(f"**Analyzed by:** {user_data.get('full_name', 'Unknown')}")
+        render_recent_history(user_data)
     
     # Main content
     if batch_mode:
-        handle_batch_processing(components)
+        handle_batch_processing()
     else:
-        handle_single_file_processing(components)
+        handle_single_file_processing()
+
+
+# The job description and batch mode widgets drive the main panel, so they stay at app
+# scope; these sidebar sections rerun on their own
+@st.fragment
+def render_user_management():
+    """Admin user management forms"""
+    login_page.show_user_management()
 
+@st.fragment
+def render_recent_history(user_data):
+    """Recent analyses for the current user"""
+    recent_history = SessionManager.get_recent_history(5)
+    if recent_history:
+        st.header("📊 Recent Analyses")
+        for history_item in recent_history:
+            with st.expander(f"{history_item['filename']} - Score: {history_item['score']:.1f}"):
+                st.write(f"**Timestamp:** {history_item['timestamp']}")
+                st.write(f"**Skills Found:** {history_item['skills_count']}")
+                st.write(f"**Analyzed by:** {user_data.get('full_name', 'Unknown')}")
+                
+                # The full result is stored compressed, so only fetch it when asked for
+                if st.toggle("Show full analysis", key=f"history_details_{history_item['id']}"):
+                    analysis = SessionManager.load_history_analysis(history_item['id'])
+                    if analysis:
+                        st.json(analysis, expanded=False)
+                    else:
+                        st.info("The full analysis is no longer available")
 
-def handle_single_file_processing(components):
+def handle_single_file_processing():
     """Handle single file processing"""
     st.header("📄 Single Resume Analysis")
     
@@ -154,20 +230,25 @@ def handle_single_file_processing(components):
     )
     
     if uploaded_file is not None:
+        # Read the upload once and share the bytes with validation and extraction
+        data = uploaded_file.getvalue()
+        
         # Validate file
-        is_valid, message = FileValidator.validate_file(uploaded_file)
+        is_valid, message = FileValidator.validate_file(uploaded_file.name, data)
         
         if not is_valid:
             st.error(message)
             return
         
         # Process file
+        loader = st.empty()
         with st.spinner("🔍 Analyzing resume..."):
-            FCGBranding.show_fcg_loader("Analyzing resume content...")
-            time.sleep(1)  # Simulate processing time
-            process_single_file(uploaded_file, components)
+            with loader.container():
+                FCGBranding.show_fcg_loader("Analyzing resume content...")
+            process_single_file(uploaded_file.name, uploaded_file.type, data)
+        loader.empty()
 
-def handle_batch_processing(components):
+def handle_batch_processing():
     """Handle batch processing of multiple files"""
     st.header("📚 Batch Resume Analysis")
     
@@ -183,68 +264,105 @@ def handle_batch_processing(components):
             st.error(f"Maximum {config['max_files_batch']} files allowed")
             return
         
-        # Process all files
-        results = []
-        progress_bar = st.progress(0)
-        
-        for i, file in enumerate(uploaded_files):
-            is_valid, message = FileValidator.validate_file(file)
+        # Validate files and read their bytes (UploadedFile objects are not picklable)
+        valid_files = []
+        for file in uploaded_files:
+            data = file.getvalue()
+            is_valid, message = FileValidator.validate_file(file.name, data)
             
             if is_valid:
-                with st.spinner(f"Processing {file.name}..."):
-                    result = process_file_for_batch(file, components)
-                    if result:
-                        results.append(result)
+                valid_files.append((file.name, data, file.type))
             else:
                 st.error(f"Error in {file.name}: {message}")
+        
+        # Jobs are prepared lazily, so each file is hashed and handed off while earlier ones are being scored
+        jobs = (
+            (filename, content_digest(data), data, file_type)
+            for filename, data, file_type in valid_files
+        )
+        
+        # Score files in parallel, keeping results in upload order
+        results_by_index = {}
+        errors_by_index = {}
+        
+        if valid_files:
+            total = len(valid_files)
+            # Push at most ~20 progress updates to the browser regardless of batch size
+            update_every = max(1, total // 20)
+            executor = get_batch_executor()
             
-            progress_bar.progress((i + 1) / len(uploaded_files))
+            with st.status(f"Processing {total} resumes...", expanded=True) as status:
+                progress_bar = st.progress(0)
+                
+                pool_broken = False
+                try:
+                    for done, (index, result) in enumerate(
+                        run_batch(executor, jobs, st.session_state.current_job_description), start=1
+                    ):
+                        if 'error' in result:
+                            errors_by_index[index] = result
+                        else:
+                            results_by_index[index] = result
+                        if done % update_every == 0 or done == total:
+                            status.update(label=f"Processed {valid_files[index][0]} ({done}/{total})")
+                            progress_bar.progress(done / total)
+                except BrokenProcessPool:
+                    # A dead worker breaks the whole pool, so drop the cached one and start fresh next batch
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    get_batch_executor.clear()
+                    pool_broken = True
+                
+                if errors_by_index or pool_broken:
+                    label = f"{len(errors_by_index)} of {total} resumes failed"
+                    if pool_broken:
+                        label += " (a worker process stopped, the pool will be restarted)"
+                    status.update(label=label, state="error", expanded=False)
+                else:
+                    status.update(label=f"Processed {total} resumes", state="complete", expanded=False)
+        
+        for index in sorted(errors_by_index):
+            error = errors_by_index[index]
+            st.error(f"Error in {error['name']}: {error['error']}")
+        
+        results = [results_by_index[index] for index in sorted(results_by_index)]
         
         # Display batch results
         if results:
-            display_batch_results(results, components)
+            display_batch_results(results)
 
-def process_single_file(uploaded_file, components):
+def process_single_file(filename: str, file_type: str, data: bytes):
     """Process a single resume file"""
     # Extract text
-    text = components['extractor'].extract_text(uploaded_file)
+    digest = content_digest(data)
+    text = extract_text_cached(digest, file_type, data)
     
     if not text:
         st.error("Could not extract text from the file")
         return
     
     # Analyze resume with job description and title
-    analysis_result = components['analyzer'].calculate_resume_score(
-        text, 
-        st.session_state.current_job_description,
-        "Market Research Analyst"
+    job_description = st.session_state.current_job_description
+    job_description_digest = content_digest(job_description.encode())
+    analysis_result = score_resume_cached(
+        digest,
+        job_description_digest,
+        "Market Research Analyst",
+        text,
+        job_description
     )
     
     # Add analyst info to analysis result
     analysis_result['analyzed_by'] = st.session_state.get('user_data', {}).get('full_name', 'Unknown')
     
-    SessionManager.add_analysis_to_history(analysis_result, uploaded_file.name)
-    
-    display_single_analysis_results(analysis_result, uploaded_file.name, components)
-
-def process_file_for_batch(uploaded_file, components):
-    """Process file for batch analysis"""
-    text = components['extractor'].extract_text(uploaded_file)
-    
-    if not text:
-        return None
-    
-    analysis_result = components['analyzer'].calculate_resume_score(
-        text, 
-        st.session_state.current_job_description
-    )
+    # Record each distinct analysis once rather than on every rerun
+    history_key = (digest, job_description_digest)
+    if st.session_state.get('last_history_key') != history_key:
+        SessionManager.add_analysis_to_history(analysis_result, filename)
+        st.session_state.last_history_key = history_key
     
-    return {
-        'name': uploaded_file.name,
-        'analysis': analysis_result
-    }
+    display_single_analysis_results(analysis_result, filename)
 
-def display_single_analysis_results(analysis_result, filename, components):
+def display_single_analysis_results(analysis_result, filename):
     """Display results for single file analysis"""
     st.success(f"✅ Analysis completed for {filename}")
     
@@ -253,7 +371,7 @@ def display_single_analysis_results(analysis_result, filename, components):
     
     with col1:
         # Overall score gauge
-        score_fig = components['visualizer'].create_score_gauge(analysis_result['overall_score'])
+        score_fig = score_gauge_figure(analysis_result['overall_score'])
         st.plotly_chart(score_fig, use_container_width=True)
         
         # Score interpretation
@@ -271,7 +389,7 @@ def display_single_analysis_results(analysis_result, filename, components):
     
     with col2:
         # Detailed scores radar chart
-        radar_fig = components['visualizer'].create_detailed_scores_radar(analysis_result['detailed_scores'])
+        radar_fig = scores_radar_figure(analysis_result['detailed_scores'])
         st.plotly_chart(radar_fig, use_container_width=True)
     
     # Skills analysis
@@ -281,13 +399,13 @@ def display_single_analysis_results(analysis_result, filename, components):
     
     with col1:
         # Skills bar chart
-        skills_fig = components['visualizer'].create_skills_bar_chart(analysis_result['skills_found'])
+        skills_fig = skills_bar_figure(analysis_result['skills_found'])
         st.plotly_chart(skills_fig, use_container_width=True)
     
     with col2:
         # Skills word cloud
         try:
-            wordcloud_fig = components['visualizer'].create_skills_wordcloud(analysis_result['skills_found'])
+            wordcloud_fig = skills_wordcloud_figure(analysis_result['skills_found'])
             if wordcloud_fig:
                 st.pyplot(wordcloud_fig)
         except:
@@ -295,7 +413,7 @@ def display_single_analysis_results(analysis_result, filename, components):
     
     # Detailed skills breakdown
     st.header("📋 Detailed Skills Breakdown")
-    components['visualizer'].display_skills_breakdown(analysis_result['skills_found'])
+    get_visualizer().display_skills_breakdown(analysis_result['skills_found'])
     
     # Experience and Education
     col1, col2 = st.columns([1, 1])
@@ -321,7 +439,7 @@ def display_single_analysis_results(analysis_result, filename, components):
     
     # Recommendations
     st.header("💡 AI Recommendations")
-    recommendations = components['analyzer'].get_recommendations(analysis_result)
+    recommendations = get_analyzer().get_recommendations(analysis_result)
     
     for rec in recommendations:
         st.write(rec)
@@ -333,48 +451,56 @@ def display_single_analysis_results(analysis_result, filename, components):
         'analysis_result': analysis_result,
         'recommendations': recommendations,
         'analyzed_by': st.session_state.get('user_data', {}).get('full_name', 'Unknown'),
-        'timestamp': pd.Timestamp.now().isoformat()
+        'timestamp': datetime.now()
     }
     
     st.download_button(
         label="Download Analysis Report (JSON)",
-        data=json.dumps(download_data, indent=2),
+        data=orjson.dumps(download_data, option=orjson.OPT_INDENT_2),
         file_name=f"{filename}_analysis_report.json",
         mime="application/json"
     )
 
-def display_batch_results(results, components):
+def display_batch_results(results):
     """Display results for batch processing"""
     st.success(f"✅ Batch analysis completed for {len(results)} files")
     
-    # Create comparison dataframe
-    comparison_data = []
-    for result in results:
-        comparison_data.append({
-            'Filename': result['name'],
-            'Overall Score': result['analysis']['overall_score'],
-            'Skills Count': result['analysis']['total_skills_count'],
-            'Experience Score': result['analysis']['detailed_scores']['experience'],
-            'Education Score': result['analysis']['detailed_scores']['education']
-        })
-    
-    df = pd.DataFrame(comparison_data)
+    # Create comparison dataframe column by column
+    analyses = [result['analysis'] for result in results]
+    df = pd.DataFrame({
+        'Filename': [result['name'] for result in results],
+        'Overall Score': [analysis['overall_score'] for analysis in analyses],
+        'Skills Count': [analysis['total_skills_count'] for analysis in analyses],
+        'Experience Score': [analysis['detailed_scores']['experience'] for analysis in analyses],
+        'Education Score': [analysis['detailed_scores']['education'] for analysis in analyses]
+    })
     
     # Display comparison table
     st.header("📊 Batch Comparison Results")
-    st.dataframe(df.style.background_gradient(subset=['Overall Score']), use_container_width=True)
+    st.dataframe(
+        df,
+        column_config={
+            'Overall Score': st.column_config.ProgressColumn(
+                'Overall Score', format="%.1f", min_value=0, max_value=100
+            )
+        },
+        use_container_width=True
+    )
     
     # Top candidates
     st.header("🏆 Top Candidates")
     top_candidates = df.nlargest(3, 'Overall Score')
     
-    for i, (idx, candidate) in enumerate(top_candidates.iterrows()):
-        st.write(f"**{i+1}. {candidate['Filename']}** - Score: {candidate['Overall Score']:.1f}")
+    for i, (filename, score) in enumerate(zip(top_candidates['Filename'], top_candidates['Overall Score'])):
+        st.write(f"**{i+1}. {filename}** - Score: {score:.1f}")
     
     # Download batch results
+    csv_buffer = io.BytesIO()
+    df.to_csv(csv_buffer, index=False)
+    
     st.download_button(
         label="Download Batch Results (CSV)",
-        data=df.to_csv(index=False),
+        data=csv_buffer.getvalue(),
         file_name="batch_analysis_results.csv",
         mime="text/csv"
     )
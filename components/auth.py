@@ -1,7 +1,9 @@
 import streamlit as st
 import hashlib
-import json
+import orjson
 import os
+import secrets
+import tempfile
 from datetime import datetime, timedelta
 from typing import Dict, Optional
 import time
@@ -12,6 +14,8 @@ class AuthManager:
     def __init__(self):
         self.users_file = "data/users.json"
         self.sessions_file = "data/sessions.json"
+        # Parsed file contents keyed by path, with the (inode, mtime, size) they were read at
+        self._file_cache = {}
         self.ensure_data_files()
         
     def ensure_data_files(self):
@@ -48,31 +52,58 @@ class AuthManager:
         """Hash password using SHA-256"""
         return hashlib.sha256(password.encode()).hexdigest()
     
+    def read_json_file(self, path: str) -> Dict:
+        """Load a JSON file, reparsing it only when it has changed on disk"""
+        stat = os.stat(path)
+        # Every write replaces the file, so the inode changes even when size and timestamp don't
+        file_key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        
+        cached = self._file_cache.get(path)
+        if cached is None or cached[0] != file_key:
+            with open(path, 'rb') as f:
+                cached = (file_key, orjson.loads(f.read()))
+            self._file_cache[path] = cached
+        return cached[1]
+    
+    def write_json_file(self, path: str, data: Dict):
+        """Write a JSON file atomically so readers never see a partial file"""
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except:
+            os.unlink(tmp_path)
+            raise
+        
+        # Cache what was just written, so our own writes never depend on the stat key changing
+        stat = os.stat(path)
+        self._file_cache[path] = ((stat.st_ino, stat.st_mtime_ns, stat.st_size), orjson.loads(payload))
+    
     def load_users(self) -> Dict:
         """Load users from JSON file"""
         try:
-            with open(self.users_file, 'r') as f:
-                return json.load(f)
+            # Callers update users in place, so hand out copies of the cached records
+            return {username: dict(user) for username, user in self.read_json_file(self.users_file).items()}
         except:
             return {}
     
     def save_users(self, users: Dict):
         """Save users to JSON file"""
-        with open(self.users_file, 'w') as f:
-            json.dump(users, f, indent=2)
+        self.write_json_file(self.users_file, users)
     
     def load_sessions(self) -> Dict:
         """Load sessions from JSON file"""
         try:
-            with open(self.sessions_file, 'r') as f:
-                return json.load(f)
+            # Callers add and remove sessions, so hand out a copy of the cached mapping
+            return dict(self.read_json_file(self.sessions_file))
         except:
             return {}
     
     def save_sessions(self, sessions: Dict):
         """Save sessions to JSON file"""
-        with open(self.sessions_file, 'w') as f:
-            json.dump(sessions, f, indent=2)
+        self.write_json_file(self.sessions_file, sessions)
     
     def authenticate_user(self, username: str, password: str) -> Optional[Dict]:
         """Authenticate user credentials"""
@@ -98,9 +129,18 @@ class AuthManager:
     
     def create_session(self, user_data: Dict) -> str:
         """Create a new session for authenticated user"""
-        session_id = hashlib.sha256(f"{user_data['username']}{datetime.now()}".encode()).hexdigest()
+        # Random rather than derived from the username and time, so session ids can't be guessed
+        session_id = secrets.token_hex(32)
         
         sessions = self.load_sessions()
+        
+        # Drop expired sessions while the file is being rewritten anyway, so it doesn't grow without bound
+        now = datetime.now()
+        sessions = {
+            existing_id: session for existing_id, session in sessions.items()
+            if datetime.fromisoformat(session['expires_at']) > now
+        }
+        
         sessions[session_id] = {
             'user_data': user_data,
             'created_at': datetime.now().isoformat(),
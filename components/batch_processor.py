@@ -0,0 +1,138 @@
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from components.text_extractor import TextExtractor
+from utils.text_cache import text_cache
+
+# Maximum number of resumes in flight at once. Jobs are pulled from the input
+# iterable only as slots free up, which bounds memory on large batches.
+MAX_CONCURRENT_RESULTS = 32
+
+# Analyzer owned by the current worker process, created on first use
+_worker_analyzer = None
+
+
+def _get_worker_analyzer():
+    """Return this worker's analyzer, loading it on first use"""
+    global _worker_analyzer
+    if _worker_analyzer is None:
+        from components.ai_analyzer import JobMatchingAIAnalyzer
+        _worker_analyzer = JobMatchingAIAnalyzer()
+    return _worker_analyzer
+
+
+def _read_shared_bytes(shm_name: str, size: int) -> bytes:
+    """Copy a published file out of shared memory"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        return bytes(shm.buf[:size])
+    finally:
+        shm.close()
+
+
+def process_resume(filename: str, digest: str, file_type: str, job_description: str,
+                   shm_name: Optional[str] = None, size: int = 0, text: Optional[str] = None) -> Dict:
+    """Extract and score a single resume inside a worker process"""
+    # st.error goes nowhere in a worker, so extraction errors are raised and reported by the app
+    if text is None:
+        text = text_cache.get_or_extract(
+            digest,
+            lambda: TextExtractor.read_text(_read_shared_bytes(shm_name, size), file_type)
+        )
+    
+    if not text:
+        return {'name': filename, 'error': "Could not extract text from the file"}
+    
+    analysis_result = _get_worker_analyzer().calculate_resume_score(text, job_description)
+    
+    return {
+        'name': filename,
+        'analysis': analysis_result
+    }
+
+
+def create_executor(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """Create the worker pool used for batch scoring"""
+    # Spawn rather than fork: the Streamlit server process is multi-threaded
+    return ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count() or 1,
+        mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+def run_batch(executor: ProcessPoolExecutor, jobs: Iterable[Tuple[str, str, bytes, str]], job_description: str,
+              max_concurrent: int = MAX_CONCURRENT_RESULTS) -> Iterator[Tuple[int, Dict]]:
+    """Score (filename, digest, data, file_type) jobs on the executor, yielding (index, result) as each completes.
+    
+    A file that fails yields {'name': ..., 'error': ...} instead of its analysis. If a worker process dies,
+    the remaining files are reported as failed and BrokenProcessPool is raised once they have all been yielded.
+    """
+    pending = {}
+    broken = False
+    
+    def release(shm):
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+    
+    def collect(done):
+        nonlocal broken
+        for future in done:
+            index, filename, shm = pending.pop(future)
+            # The worker has copied the bytes out by now, release the segment
+            release(shm)
+            try:
+                result = future.result()
+            except BrokenProcessPool:
+                broken = True
+                result = {'name': filename, 'error': "A worker process stopped unexpectedly"}
+            except Exception as e:
+                result = {'name': filename, 'error': str(e)}
+            yield index, result
+    
+    try:
+        for index, (filename, digest, data, file_type) in enumerate(jobs):
+            # Wait for a free slot before submitting more work
+            while len(pending) >= max_concurrent:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                yield from collect(done)
+            
+            if broken:
+                yield index, {'name': filename, 'error': "Not processed, the worker pool stopped"}
+                continue
+            
+            # Already-extracted resumes skip extraction and don't ship their bytes to the worker
+            text = text_cache.get(digest)
+            shm = None
+            try:
+                if text is not None:
+                    future = executor.submit(process_resume, filename, digest, file_type, job_description, text=text)
+                else:
+                    # Publish the bytes once in shared memory instead of pickling them through the pipe
+                    shm = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+                    shm.buf[:len(data)] = data
+                    future = executor.submit(process_resume, filename, digest, file_type, job_description,
+                                             shm_name=shm.name, size=len(data))
+            except BrokenProcessPool:
+                release(shm)
+                broken = True
+                yield index, {'name': filename, 'error': "Not processed, the worker pool stopped"}
+                continue
+            pending[future] = (index, filename, shm)
+        
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            yield from collect(done)
+        
+        # Every file has been reported, now let the caller replace the dead pool
+        if broken:
+            raise BrokenProcessPool("A worker process stopped unexpectedly during the batch")
+    finally:
+        # Make sure no segment outlives an abandoned batch
+        for future, (_, _, shm) in pending.items():
+            future.cancel()
+            release(shm)
@@ -1,6 +1,7 @@
 import streamlit as st
 import time
 import base64
+from functools import lru_cache
 from typing import Optional
 
 class FCGBranding:
@@ -22,9 +23,15 @@ class FCGBranding:
     @staticmethod
     def inject_fcg_css():
         """Inject FCG custom CSS"""
+        st.markdown(FCGBranding.build_fcg_css(), unsafe_allow_html=True)
+    
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def build_fcg_css() -> str:
+        """Build the FCG stylesheet once per process, since it never changes between reruns"""
         colors = FCGBranding.get_fcg_colors()
         
-        st.markdown(f"""
+        return f"""
         <style>
         /* FCG Color Scheme */
         :root {{
@@ -167,7 +174,7 @@ class FCGBranding:
             color: {colors['text']};
         }}
         </style>
-        """, unsafe_allow_html=True)
+        """
     
     @staticmethod
     def show_fcg_header():
@@ -1,13 +1,13 @@
 import streamlit as st
-import time
+from typing import Optional
 from components.auth import AuthManager
 from components.branding import FCGBranding
 
 class LoginPage:
     """Professional login page for Four Corners Group"""
     
-    def __init__(self):
-        self.auth_manager = AuthManager()
+    def __init__(self, auth_manager: Optional[AuthManager] = None):
+        self.auth_manager = auth_manager or AuthManager()
         
     def show_login_page(self):
         """Display the main login page"""
@@ -52,7 +52,6 @@ class LoginPage:
         # Show loader
         with st.spinner("Authenticating..."):
             FCGBranding.show_fcg_loader("Verifying credentials...")
-            time.sleep(1)  # Simulate authentication delay
             
             user_data = self.auth_manager.authenticate_user(username, password)
             
@@ -65,11 +64,7 @@ class LoginPage:
                 st.session_state['session_id'] = session_id
                 st.session_state['user_data'] = user_data
                 
-                # Show success message
-                st.success(f"✅ Welcome, {user_data['full_name']}!")
-                
                 # Redirect to main app
-                time.sleep(1)
                 st.rerun()
             else:
                 st.error("❌ Invalid username or password")
@@ -149,7 +144,6 @@ class LoginPage:
             self.auth_manager.logout_user(st.session_state['session_id'])
         
         # Clear session state
-        for key in list(st.session_state.keys()):
-            del st.session_state[key]
+        st.session_state.clear()
         
         st.rerun()
\ No newline at end of file
@@ -0,0 +1,250 @@
+# Built-in skills database used when data/skills_database.json is missing.
+# Kept out of ai_analyzer so the literal is only compiled and built on that fallback path.
+
+# MASSIVE comprehensive skills database covering ALL job types
+DEFAULT_SKILLS_DATABASE = {
+    # Programming & Technical Skills
+    "programming_languages": {
+        "web_development": ["javascript", "typescript", "html", "css", "php", "ruby", "node.js"],
+        "backend": ["python", "java", "c#", "c++", "go", "rust", "scala", "kotlin", "asp.net"],
+        "mobile": ["swift", "objective-c", "dart", "flutter", "react native", "xamarin", "ionic"],
+        "data_science": ["python", "r", "matlab", "julia", "sql", "sas", "spss", "stata"],
+        "systems": ["c", "c++", "assembly", "verilog", "vhdl", "embedded c", "arduino"],
+        "scripting": ["bash", "powershell", "perl", "lua", "tcl", "awk", "sed"]
+    },
+    "web_technologies": {
+        "frontend_frameworks": ["react", "angular", "vue.js", "svelte", "ember.js", "backbone.js"],
+        "backend_frameworks": ["django", "flask", "express.js", "spring", "laravel", "rails", "fastapi"],
+        "css_frameworks": ["bootstrap", "tailwind", "bulma", "foundation", "materialize"],
+        "build_tools": ["webpack", "gulp", "grunt", "parcel", "vite", "rollup", "esbuild"],
+        "cms": ["wordpress", "drupal", "joomla", "strapi", "contentful", "sanity"]
+    },
+    "databases": {
+        "relational": ["mysql", "postgresql", "sqlite", "oracle", "sql server", "mariadb"],
+        "nosql": ["mongodb", "redis", "cassandra", "dynamodb", "couchdb", "firebase"],
+        "graph": ["neo4j", "amazon neptune", "arangodb", "dgraph"],
+        "time_series": ["influxdb", "timescaledb", "prometheus", "clickhouse"],
+        "data_warehousing": ["snowflake", "redshift", "bigquery", "synapse", "teradata"]
+    },
+    "cloud_platforms": {
+        "aws": ["ec2", "s3", "lambda", "rds", "cloudformation", "eks", "ecs", "sagemaker"],
+        "azure": ["azure functions", "blob storage", "cosmos db", "aks", "azure ml", "power platform"],
+        "gcp": ["compute engine", "cloud storage", "bigquery", "gke", "cloud functions", "vertex ai"],
+        "general": ["docker", "kubernetes", "terraform", "ansible", "vagrant", "helm"],
+        "devops": ["jenkins", "gitlab ci", "github actions", "travis ci", "circleci", "teamcity"]
+    },
+
+    # Culinary & Food Service Skills
+    "culinary_skills": {
+        "cooking_techniques": ["grilling", "roasting", "sautéing", "braising", "poaching", "frying", "steaming", "baking", "broiling", "smoking", "sous vide", "confit", "flambé"],
+        "cuisine_types": ["italian", "french", "asian", "mexican", "mediterranean", "american", "indian", "thai", "chinese", "japanese", "korean", "middle eastern", "fusion"],
+        "food_preparation": ["knife skills", "food prep", "mise en place", "plating", "garnishing", "portioning", "butchery", "filleting", "vegetable carving"],
+        "kitchen_management": ["inventory", "cost control", "menu planning", "kitchen safety", "sanitation", "haccp", "food ordering", "staff scheduling", "quality control"],
+        "specialized_skills": ["pastry", "bread making", "wine pairing", "molecular gastronomy", "farm to table", "organic cooking", "dietary restrictions", "allergen management"],
+        "baking_pastry": ["bread making", "cake decorating", "pastry arts", "chocolate work", "sugar work", "lamination", "fermentation", "artisan breads"],
+        "beverage": ["coffee preparation", "tea blending", "cocktail mixing", "wine service", "beer knowledge", "spirits knowledge", "barista skills"],
+        "dietary_specializations": ["vegan cooking", "vegetarian", "gluten-free", "keto", "paleo", "diabetic-friendly", "halal", "kosher", "raw food"]
+    },
+
+    # Healthcare & Medical Skills
+    "healthcare_skills": {
+        "clinical": ["patient care", "vital signs", "medication administration", "wound care", "iv therapy", "injections", "blood draws"],
+        "diagnostic": ["x-ray", "mri", "ct scan", "ultrasound", "blood work", "ecg", "ekg", "spirometry"],
+        "specialties": ["emergency medicine", "pediatrics", "cardiology", "oncology", "surgery", "anesthesia", "psychiatry", "dermatology"],
+        "certifications": ["cpr", "bls", "acls", "pals", "cna", "rn", "lpn", "nrp", "tncc"],
+        "nursing": ["bedside manner", "patient assessment", "care planning", "documentation", "family education", "discharge planning"],
+        "medical_admin": ["medical coding", "icd-10", "cpt codes", "insurance verification", "emr systems", "epic", "cerner"],
+        "laboratory": ["phlebotomy", "lab testing", "specimen collection", "microscopy", "blood bank", "microbiology"],
+        "therapy": ["physical therapy", "occupational therapy", "speech therapy", "respiratory therapy", "massage therapy"]
+    },
+
+    # Creative & Entertainment
+    "creative_arts": {
+        "music": ["singing", "vocal performance", "music theory", "composition", "live performance", "stage presence", "pitch control"],
+        "performance": ["stage presence", "audience engagement", "entertainment", "acting", "dancing", "comedy", "storytelling"],
+        "production": ["studio recording", "audio production", "mixing", "mastering", "sound engineering", "music production"],
+        "instruments": ["guitar", "piano", "drums", "violin", "saxophone", "bass", "keyboard", "flute", "trumpet"],
+        "genres": ["pop", "rock", "jazz", "classical", "country", "r&b", "hip hop", "folk", "blues", "electronic"],
+        "visual_arts": ["painting", "drawing", "sculpture", "photography", "graphic design", "illustration", "digital art"],
+        "design": ["ui/ux design", "web design", "logo design", "branding", "typography", "color theory", "adobe creative suite"],
+        "video": ["video editing", "cinematography", "animation", "motion graphics", "after effects", "premiere pro"]
+    },
+
+    # Business & Finance
+    "business_finance": {
+        "accounting": ["bookkeeping", "financial statements", "tax preparation", "auditing", "accounts payable", "accounts receivable", "payroll"],
+        "analysis": ["financial analysis", "budget planning", "forecasting", "cost analysis", "roi analysis", "variance analysis", "ratio analysis"],
+        "tools": ["excel", "quickbooks", "sap", "oracle", "bloomberg", "sage", "xero", "freshbooks"],
+        "certifications": ["cpa", "cfa", "frm", "cma", "cia", "acca", "ca", "cga"],
+        "banking": ["commercial banking", "investment banking", "retail banking", "credit analysis", "loan processing", "risk management"],
+        "insurance": ["underwriting", "claims processing", "actuarial analysis", "risk assessment", "policy administration"],
+        "investments": ["portfolio management", "equity research", "fixed income", "derivatives", "asset management", "wealth management"]
+    },
+
+    # Sales & Marketing
+    "sales_marketing": {
+        "sales": ["lead generation", "cold calling", "client relationships", "closing deals", "crm", "b2b sales", "b2c sales", "inside sales"],
+        "digital_marketing": ["seo", "sem", "social media", "content marketing", "email marketing", "ppc", "google ads", "facebook ads"],
+        "traditional_marketing": ["print advertising", "radio", "tv", "outdoor advertising", "events", "trade shows", "direct mail"],
+        "analytics": ["google analytics", "facebook insights", "conversion tracking", "a/b testing", "marketing automation"],
+        "brand_management": ["brand strategy", "brand positioning", "brand awareness", "brand equity", "corporate identity"],
+        "public_relations": ["media relations", "press releases", "crisis communication", "event planning", "corporate communications"],
+        "e_commerce": ["shopify", "magento", "woocommerce", "amazon fba", "dropshipping", "marketplace management"]
+    },
+
+    # Education & Training
+    "education_skills": {
+        "teaching": ["lesson planning", "curriculum development", "classroom management", "assessment", "differentiated instruction"],
+        "training": ["corporate training", "skill development", "workshop facilitation", "e-learning", "instructional design"],
+        "specialties": ["special education", "esl", "stem", "arts education", "adult education", "early childhood"],
+        "technology": ["learning management systems", "educational technology", "online teaching", "virtual classrooms"],
+        "administration": ["school administration", "educational leadership", "policy development", "budget management"],
+        "counseling": ["academic counseling", "career guidance", "student support", "behavioral intervention"]
+    },
+
+    # Manufacturing & Engineering
+    "manufacturing_engineering": {
+        "mechanical": ["mechanical engineering", "cad design", "autocad", "solidworks", "manufacturing processes", "quality control"],
+        "electrical": ["electrical engineering", "circuit design", "plc programming", "automation", "control systems"],
+        "industrial": ["industrial engineering", "process optimization", "lean manufacturing", "six sigma", "operations research"],
+        "civil": ["civil engineering", "structural design", "construction management", "project planning", "surveying"],
+        "chemical": ["chemical engineering", "process engineering", "chemical processes", "safety protocols"],
+        "production": ["production planning", "inventory management", "supply chain", "logistics", "warehouse management"],
+        "quality": ["quality assurance", "iso standards", "statistical process control", "inspection", "testing"]
+    },
+
+    # Legal & Compliance
+    "legal_skills": {
+        "practice_areas": ["corporate law", "criminal law", "family law", "real estate law", "intellectual property", "employment law"],
+        "litigation": ["trial advocacy", "legal research", "brief writing", "depositions", "negotiations", "mediation"],
+        "compliance": ["regulatory compliance", "risk management", "policy development", "audit", "governance"],
+        "documentation": ["contract drafting", "legal writing", "case management", "document review"],
+        "paralegal": ["legal assistant", "case preparation", "client communication", "filing", "research support"]
+    },
+
+    # Transportation & Logistics
+    "transportation_logistics": {
+        "driving": ["commercial driving", "cdl", "truck driving", "delivery services", "route planning", "vehicle maintenance"],
+        "logistics": ["supply chain management", "inventory control", "warehouse operations", "shipping", "receiving"],
+        "aviation": ["pilot license", "air traffic control", "aircraft maintenance", "flight operations", "aviation safety"],
+        "maritime": ["ship operations", "navigation", "marine engineering", "port operations", "maritime safety"],
+        "public_transport": ["bus driving", "train operations", "transit planning", "passenger service"]
+    },
+
+    # Agriculture & Environment
+    "agriculture_environment": {
+        "farming": ["crop management", "livestock care", "irrigation", "pest control", "organic farming", "sustainable agriculture"],
+        "environmental": ["environmental science", "conservation", "sustainability", "waste management", "renewable energy"],
+        "forestry": ["forest management", "timber harvesting", "wildlife conservation", "fire prevention"],
+        "veterinary": ["animal care", "veterinary medicine", "animal behavior", "pet grooming", "animal training"]
+    },
+
+    # Security & Safety
+    "security_safety": {
+        "security": ["physical security", "cybersecurity", "surveillance", "access control", "security protocols", "risk assessment"],
+        "law_enforcement": ["police work", "criminal investigation", "forensics", "emergency response", "public safety"],
+        "fire_safety": ["firefighting", "fire prevention", "emergency medical services", "hazmat response", "rescue operations"],
+        "occupational_safety": ["workplace safety", "osha compliance", "safety training", "accident investigation", "safety audits"]
+    },
+
+    # Real Estate & Construction
+    "real_estate_construction": {
+        "real_estate": ["property management", "real estate sales", "property valuation", "leasing", "real estate investment"],
+        "construction": ["construction management", "carpentry", "plumbing", "electrical work", "masonry", "roofing"],
+        "architecture": ["architectural design", "building codes", "construction drawings", "project management"],
+        "trades": ["welding", "painting", "flooring", "hvac", "landscaping", "demolition"]
+    },
+
+    # Hospitality & Tourism
+    "hospitality_tourism": {
+        "hotel_management": ["front desk operations", "housekeeping", "concierge services", "revenue management", "guest relations"],
+        "food_service": ["restaurant management", "catering", "banquet services", "menu planning", "cost control"],
+        "tourism": ["tour guide", "travel planning", "destination management", "cultural interpretation", "language skills"],
+        "event_planning": ["event coordination", "wedding planning", "corporate events", "vendor management", "budget planning"]
+    },
+
+    # Sports & Recreation
+    "sports_recreation": {
+        "coaching": ["sports coaching", "athletic training", "fitness instruction", "team management", "player development"],
+        "fitness": ["personal training", "group fitness", "yoga instruction", "nutrition counseling", "exercise physiology"],
+        "sports_specific": ["football", "basketball", "soccer", "tennis", "swimming", "track and field", "martial arts"],
+        "recreation": ["camp counseling", "outdoor recreation", "adventure sports", "community recreation"]
+    },
+
+    # Retail & Customer Service
+    "retail_customer_service": {
+        "retail": ["retail sales", "merchandising", "inventory management", "pos systems", "visual merchandising"],
+        "customer_service": ["call center", "customer support", "complaint resolution", "phone etiquette", "chat support"],
+        "cashier": ["cash handling", "payment processing", "register operations", "money counting", "transaction processing"]
+    },
+
+    # Human Resources
+    "human_resources": {
+        "recruiting": ["talent acquisition", "interviewing", "candidate screening", "job posting", "background checks"],
+        "hr_operations": ["payroll", "benefits administration", "employee relations", "policy development", "compliance"],
+        "training": ["employee training", "onboarding", "performance management", "career development", "succession planning"],
+        "compensation": ["compensation analysis", "salary surveys", "job evaluation", "incentive programs"]
+    },
+
+    # Data Science & Analytics
+    "data_science": {
+        "machine_learning": ["scikit-learn", "tensorflow", "pytorch", "keras", "xgboost", "neural networks", "deep learning"],
+        "data_analysis": ["pandas", "numpy", "scipy", "matplotlib", "seaborn", "statistical analysis", "hypothesis testing"],
+        "visualization": ["tableau", "power bi", "d3.js", "plotly", "ggplot2", "qlik", "looker"],
+        "big_data": ["hadoop", "spark", "kafka", "airflow", "databricks", "hive", "pig"],
+        "statistics": ["regression", "classification", "clustering", "time series", "bayesian analysis", "experimental design"],
+        "business_intelligence": ["data warehousing", "etl", "reporting", "dashboards", "kpi development"]
+    },
+
+    # Market Research & Analysis
+    "market_research": {
+        "quantitative": ["statistical analysis", "survey design", "a/b testing", "regression analysis", "conjoint analysis"],
+        "qualitative": ["ethnographic research", "user research", "behavioral analysis", "focus groups", "interviews"],
+        "tools": ["qualtrics", "surveymonkey", "usertesting", "hotjar", "spss", "sas", "stata"],
+        "methodologies": ["market segmentation", "brand tracking", "customer satisfaction", "pricing research", "concept testing"],
+        "digital_research": ["social media monitoring", "web analytics", "seo research", "competitive intelligence"],
+        "consumer_insights": ["consumer behavior", "purchase intent", "brand perception", "customer journey mapping"]
+    },
+
+    # Business Consulting
+    "business_consulting": {
+        "strategy": ["business strategy", "strategic planning", "competitive analysis", "market entry", "growth strategy"],
+        "operations": ["process improvement", "change management", "lean six sigma", "kaizen", "business process reengineering"],
+        "management": ["project management", "stakeholder management", "business analysis", "requirements gathering"],
+        "frameworks": ["mckinsey", "bcg", "swot analysis", "porter's five forces", "value chain analysis", "balanced scorecard"],
+        "digital_transformation": ["technology implementation", "digital strategy", "automation", "workflow optimization"],
+        "organizational": ["organizational design", "culture change", "leadership development", "team effectiveness"]
+    },
+
+    # Soft Skills with Context
+    "soft_skills": {
+        "leadership": ["leadership", "team management", "mentoring", "coaching", "delegation", "vision setting"],
+        "communication": ["communication", "presentation", "public speaking", "writing", "negotiation", "active listening"],
+        "analytical": ["problem solving", "analytical thinking", "critical thinking", "decision making", "research skills"],
+        "interpersonal": ["teamwork", "collaboration", "empathy", "emotional intelligence", "cultural sensitivity"],
+        "adaptability": ["flexibility", "adaptability", "learning agility", "innovation", "change management"],
+        "time_management": ["prioritization", "multitasking", "deadline management", "efficiency", "productivity"],
+        "creativity": ["creative thinking", "innovation", "brainstorming", "design thinking", "artistic vision"]
+    },
+
+    # Languages & Communication
+    "languages": {
+        "english": ["english", "business english", "technical writing", "academic english", "conversational english"],
+        "european": ["spanish", "french", "german", "italian", "portuguese", "dutch", "swedish", "norwegian"],
+        "asian": ["mandarin", "japanese", "korean", "hindi", "arabic", "thai", "vietnamese", "tagalog"],
+        "south_asian": ["urdu", "hindi", "bengali", "punjabi", "tamil", "gujarati", "marathi"],
+        "middle_eastern": ["arabic", "persian", "turkish", "hebrew", "kurdish"],
+        "african": ["swahili", "afrikaans", "amharic", "yoruba", "zulu"]
+    },
+
+    # Professional Certifications
+    "certifications": {
+        "it": ["cissp", "cisa", "cism", "comptia", "cisco", "microsoft", "aws", "azure", "google cloud"],
+        "project_management": ["pmp", "prince2", "agile", "scrum master", "csm", "safe", "itil"],
+        "finance": ["cpa", "cfa", "frm", "cma", "cia", "acca", "ca"],
+        "marketing": ["google ads", "facebook blueprint", "hubspot", "salesforce", "marketo"],
+        "quality": ["six sigma", "lean", "iso", "cmmi", "cobit"],
+        "healthcare": ["cpr", "bls", "acls", "pals", "tncc", "ccrn"],
+        "real_estate": ["real estate license", "property management", "appraisal certification"]
+    }
+}
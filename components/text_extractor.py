@@ -10,52 +10,47 @@ class TextExtractor:
     @staticmethod
     def extract_from_pdf(file) -> str:
         """Extract text from PDF file"""
-        try:
-            pdf_reader = PyPDF2.PdfReader(file)
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-            return text.strip()
-        except Exception as e:
-            st.error(f"Error reading PDF: {str(e)}")
-            return ""
+        pdf_reader = PyPDF2.PdfReader(file)
+        # Join once at the end instead of re-copying the text for every page
+        return "\n".join(page.extract_text() for page in pdf_reader.pages).strip()
     
     @staticmethod
     def extract_from_docx(file) -> str:
         """Extract text from DOCX file"""
-        try:
-            doc = docx.Document(file)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text.strip()
-        except Exception as e:
-            st.error(f"Error reading DOCX: {str(e)}")
-            return ""
+        doc = docx.Document(file)
+        return "\n".join(paragraph.text for paragraph in doc.paragraphs).strip()
     
     @staticmethod
     def extract_from_txt(file) -> str:
         """Extract text from TXT file"""
-        try:
-            return str(file.read(), "utf-8")
-        except Exception as e:
-            st.error(f"Error reading TXT: {str(e)}")
-            return ""
+        # Undecodable bytes are replaced rather than failing the whole file
+        return file.getvalue().decode("utf-8", errors="replace").lstrip("\ufeff").strip()
     
     @classmethod
-    def extract_text(cls, uploaded_file) -> Optional[str]:
-        """Main method to extract text based on file type"""
-        if uploaded_file is None:
-            return None
-        
-        file_type = uploaded_file.type
-        
+    def read_text(cls, data: bytes, file_type: str) -> str:
+        """Extract text from raw file bytes, raising ValueError if the file can't be read"""
         if file_type == "application/pdf":
-            return cls.extract_from_pdf(uploaded_file)
+            extract, label = cls.extract_from_pdf, "PDF"
         elif file_type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-            return cls.extract_from_docx(uploaded_file)
+            extract, label = cls.extract_from_docx, "DOCX"
         elif file_type == "text/plain":
-            return cls.extract_from_txt(uploaded_file)
+            extract, label = cls.extract_from_txt, "TXT"
         else:
-            st.error(f"Unsupported file type: {file_type}")
-            return None
\ No newline at end of file
+            raise ValueError(f"Unsupported file type: {file_type}")
+        
+        try:
+            return extract(io.BytesIO(data))
+        except Exception as e:
+            raise ValueError(f"Error reading {label}: {str(e)}") from e
+    
+    @classmethod
+    def extract_text(cls, data: bytes, file_type: str) -> Optional[str]:
+        """Main method to extract text from raw file bytes based on MIME type"""
+        if data is None:
+            return None
+        
+        try:
+            return cls.read_text(data, file_type)
+        except ValueError as e:
+            st.error(str(e))
+            return None
@@ -1,11 +1,13 @@
 import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import pandas as pd
 import streamlit as st
-from wordcloud import WordCloud
-import matplotlib.pyplot as plt
-from typing import Dict, List
+from html import escape
+from itertools import chain
+from typing import TYPE_CHECKING, Dict, List
+
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
 
 class Visualizer:
     """Create visualizations for resume analysis results"""
@@ -90,16 +92,16 @@ class Visualizer:
         return fig
     
     @staticmethod
-    def create_skills_wordcloud(skills_data: Dict[str, List[str]]) -> plt.Figure:
+    def create_skills_wordcloud(skills_data: Dict[str, List[str]]) -> "plt.Figure":
         """Create word cloud for skills"""
-        all_skills = []
-        for skills_list in skills_data.values():
-            all_skills.extend(skills_list)
+        skills_text = ' '.join(chain.from_iterable(skills_data.values()))
         
-        if not all_skills:
+        if not skills_text.strip():
             return None
         
-        skills_text = ' '.join(all_skills)
+        # wordcloud and matplotlib are slow to import and only needed here, so import them on first use
+        from wordcloud import WordCloud
+        import matplotlib.pyplot as plt
         
         wordcloud = WordCloud(
             width=800,
@@ -122,7 +124,7 @@ class Visualizer:
         if len(candidates_data) < 2:
             return None
         
-        df = pd.DataFrame(candidates_data)
+        df = pd.DataFrame.from_records(candidates_data, columns=['name', 'overall_score'])
         
         fig = px.bar(
             df,
@@ -143,7 +145,9 @@ class Visualizer:
         for category, skills in skills_data.items():
             if skills:
                 with st.expander(f"{category.replace('_', ' ').title()} ({len(skills)} skills)"):
-                    cols = st.columns(3)
-                    for i, skill in enumerate(skills):
-                        with cols[i % 3]:
-                            st.write(f"• {skill.title()}")
\ No newline at end of file
+                    # One markdown element per category instead of a write per skill
+                    items = "".join(f"<div>• {escape(skill.title())}</div>" for skill in skills)
+                    st.markdown(
+                        f"<div style='display:grid;grid-template-columns:repeat(3, 1fr);gap:4px'>{items}</div>",
+                        unsafe_allow_html=True
+                    )
\ No newline at end of file
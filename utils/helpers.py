@@ -1,13 +1,23 @@
 import streamlit as st
 import json
-from typing import Dict, List, Any
-import plotly.graph_objects as go
-import pandas as pd
+import base64
+from typing import Dict, List, Any, Optional
 import os
+import hashlib
+from collections import deque
+from itertools import islice
+from utils.history_db import HistoryStore
+
+@st.cache_resource
+def get_history_store() -> HistoryStore:
+    """Open the shared history database on first use rather than at import"""
+    return HistoryStore()
 
 class SessionManager:
     """Manage session state for the application"""
     
+    RECENT_HISTORY_SIZE = 5
+    
     @staticmethod
     def init_session_state():
         """Initialize session state variables"""
@@ -16,44 +26,59 @@ class SessionManager:
         
         if 'current_job_description' not in st.session_state:
             st.session_state.current_job_description = ""
-        
-        if 'analysis_history' not in st.session_state:
-            st.session_state.analysis_history = []
     
     @staticmethod
-    def add_analysis_to_history(analysis_result: Dict, filename: str):
+    def current_username() -> str:
+        """Username of the logged-in user, used to scope history"""
+        return st.session_state.get('user_data', {}).get('username', 'unknown')
+    
+    @classmethod
+    def recent_history(cls) -> deque:
+        """Bounded, newest-first view of the user's history, loaded from the store once per session"""
+        if 'recent_history' not in st.session_state:
+            st.session_state.recent_history = deque(
+                get_history_store().recent(cls.current_username(), cls.RECENT_HISTORY_SIZE),
+                maxlen=cls.RECENT_HISTORY_SIZE
+            )
+        return st.session_state.recent_history
+    
+    @classmethod
+    def add_analysis_to_history(cls, analysis_result: Dict, filename: str):
         """Add analysis result to history"""
-        history_item = {
-            'filename': filename,
-            'timestamp': str(pd.Timestamp.now()),
-            'analysis': analysis_result
-        }
-        st.session_state.analysis_history.append(history_item)
-        
-        # Keep only last 10 analyses
-        if len(st.session_state.analysis_history) > 10:
-            st.session_state.analysis_history = st.session_state.analysis_history[-10:]
+        entry = get_history_store().add(cls.current_username(), filename, analysis_result)
+        cls.recent_history().appendleft(entry)
+    
+    @classmethod
+    def get_recent_history(cls, limit: int = 5) -> List[Dict]:
+        """Get the user's most recent analyses, newest first"""
+        return list(islice(cls.recent_history(), limit))
+    
+    @classmethod
+    def load_history_analysis(cls, entry_id: int) -> Optional[Dict]:
+        """Load the full stored analysis for one of the current user's history entries"""
+        return get_history_store().load_analysis(cls.current_username(), entry_id)
 
 class FileValidator:
     """Validate uploaded files"""
     
-    ALLOWED_EXTENSIONS = ['pdf', 'docx', 'txt']
+    ALLOWED_EXTENSIONS = frozenset({'pdf', 'docx', 'txt'})
     MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+    MAX_FILE_SIZE_MB = MAX_FILE_SIZE / (1024 * 1024)
     
     @classmethod
-    def validate_file(cls, uploaded_file) -> tuple[bool, str]:
-        """Validate uploaded file"""
-        if uploaded_file is None:
+    def validate_file(cls, filename: str, data: bytes) -> tuple[bool, str]:
+        """Validate uploaded file from its name and contents"""
+        if data is None:
             return False, "No file uploaded"
         
         # Check file size
-        if uploaded_file.size > cls.MAX_FILE_SIZE:
-            return False, f"File size exceeds {cls.MAX_FILE_SIZE/(1024*1024):.1f}MB limit"
+        if len(data) > cls.MAX_FILE_SIZE:
+            return False, f"File size exceeds {cls.MAX_FILE_SIZE_MB:.1f}MB limit"
         
         # Check file extension
-        file_extension = uploaded_file.name.split('.')[-1].lower()
+        file_extension = os.path.splitext(filename)[1].lower().lstrip('.')
         if file_extension not in cls.ALLOWED_EXTENSIONS:
-            return False, f"Unsupported file type. Allowed: {', '.join(cls.ALLOWED_EXTENSIONS)}"
+            return False, f"Unsupported file type. Allowed: {', '.join(sorted(cls.ALLOWED_EXTENSIONS))}"
         
         return True, "File is valid"
 
@@ -95,7 +120,11 @@ def format_score_color(score: float) -> str:
     else:
         return "red"
 
+def content_digest(data: bytes) -> str:
+    """Return a short content hash used as a cache key for uploaded files"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
 def create_download_link(data: Dict, filename: str) -> str:
     """Create download link for analysis results"""
-    json_data = json.dumps(data, indent=2)
-    return f'<a href="data:application/json;base64,{json_data}" download="{filename}">Download Analysis Results</a>'
\ No newline at end of file
+    payload = base64.b64encode(json.dumps(data, separators=(',', ':')).encode('utf-8')).decode('ascii')
+    return f'<a href="data:application/json;base64,{payload}" download="{filename}">Download Analysis Results</a>'
\ No newline at end of file
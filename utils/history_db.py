@@ -0,0 +1,85 @@
+import os
+import sqlite3
+import zlib
+import orjson
+from contextlib import closing
+from datetime import datetime
+from typing import Dict, List, Optional
+
+class HistoryStore:
+    """Persist analysis history in a shared SQLite database"""
+    
+    def __init__(self, db_file: str = "data/history.db"):
+        self.db_file = db_file
+        self.ensure_schema()
+    
+    def connect(self) -> sqlite3.Connection:
+        """Open a connection in autocommit mode"""
+        conn = sqlite3.connect(self.db_file, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+    
+    def ensure_schema(self):
+        """Create the history table if it doesn't exist"""
+        os.makedirs(os.path.dirname(self.db_file) or ".", exist_ok=True)
+        
+        with closing(self.connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS analysis_history (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    user TEXT NOT NULL,
+                    filename TEXT NOT NULL,
+                    score REAL,
+                    skills_count INTEGER,
+                    timestamp TEXT NOT NULL,
+                    analysis_json BLOB
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_history_user ON analysis_history (user, id)")
+    
+    def add(self, user: str, filename: str, analysis_result: Dict) -> Dict:
+        """Store an analysis result and return its history summary"""
+        entry = {
+            'filename': filename,
+            'score': analysis_result.get('overall_score'),
+            'skills_count': analysis_result.get('total_skills_count'),
+            'timestamp': str(datetime.now())
+        }
+        
+        with closing(self.connect()) as conn:
+            cursor = conn.execute(
+                "INSERT INTO analysis_history (user, filename, score, skills_count, timestamp, analysis_json) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    user,
+                    entry['filename'],
+                    entry['score'],
+                    entry['skills_count'],
+                    entry['timestamp'],
+                    zlib.compress(orjson.dumps(analysis_result))
+                )
+            )
+        
+        return {'id': cursor.lastrowid, **entry}
+    
+    def recent(self, user: str, limit: int = 5) -> List[Dict]:
+        """Return the most recent analyses for a user, newest first"""
+        with closing(self.connect()) as conn:
+            rows = conn.execute(
+                "SELECT id, filename, score, skills_count, timestamp FROM analysis_history "
+                "WHERE user = ? ORDER BY id DESC LIMIT ?",
+                (user, limit)
+            ).fetchall()
+        return [dict(row) for row in rows]
+    
+    def load_analysis(self, user: str, entry_id: int) -> Optional[Dict]:
+        """Load the full analysis result for one of a user's history entries"""
+        with closing(self.connect()) as conn:
+            row = conn.execute(
+                "SELECT analysis_json FROM analysis_history WHERE id = ? AND user = ?", (entry_id, user)
+            ).fetchone()
+        
+        if row is None or row['analysis_json'] is None:
+            return None
+        return orjson.loads(zlib.decompress(row['analysis_json']))
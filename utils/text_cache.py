@@ -0,0 +1,175 @@
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+# Temp files older than this are left over from a crashed write and are swept on the next prune
+STALE_TMP_SECONDS = 60 * 60
+
+class TextCache:
+    """Two-tier (memory, then disk) cache of extracted resume text keyed on content digest"""
+    
+    def __init__(self, cache_dir: str = "data/text_cache", max_memory_entries: int = 512,
+                 max_disk_bytes: int = 1024 * 1024 * 1024, max_age_seconds: int = 7 * 24 * 60 * 60,
+                 rescan_every: int = 256):
+        # The disk tier holds full resume text, so it lives in a private directory under the app's data
+        # folder and entries expire max_age_seconds after they were written
+        self.cache_dir = cache_dir
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.max_age_seconds = max_age_seconds
+        self.rescan_every = rescan_every
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        # Whether the disk tier is usable, decided on first use so importing this module touches no files
+        self._disk_ready = None
+        # Estimated size of the disk tier; other processes write to it too, so it is re-measured periodically
+        self._disk_bytes = None
+        self._puts_since_scan = 0
+    
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.cache_dir, f"{digest}.txt")
+    
+    def _disk_available(self) -> bool:
+        """Create the 0700 cache directory, refusing one this process doesn't own"""
+        if self._disk_ready is None:
+            try:
+                os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+                stat = os.lstat(self.cache_dir)
+                owned = not hasattr(os, "getuid") or stat.st_uid == os.getuid()
+                if owned and os.path.isdir(self.cache_dir) and not os.path.islink(self.cache_dir):
+                    if stat.st_mode & 0o077:
+                        os.chmod(self.cache_dir, 0o700)
+                    self._disk_ready = True
+                else:
+                    self._disk_ready = False
+            except OSError:
+                self._disk_ready = False
+        return self._disk_ready
+    
+    def get(self, digest: str) -> Optional[str]:
+        """Return cached text for a digest, or None on a miss"""
+        with self._lock:
+            if digest in self._memory:
+                self._memory.move_to_end(digest)
+                return self._memory[digest]
+        
+        if not self._disk_available():
+            return None
+        
+        path = self._path(digest)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                written_at = os.fstat(f.fileno()).st_mtime
+                expired = time.time() - written_at > self.max_age_seconds
+                text = None if expired else f.read()
+        except OSError:
+            return None
+        
+        if expired:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        
+        # The atime records the last use for eviction; the mtime stays the write time entries expire from
+        try:
+            os.utime(path, (time.time(), written_at))
+        except OSError:
+            pass
+        
+        self._remember(digest, text)
+        return text
+    
+    def get_or_extract(self, digest: str, extract: Callable[[], Optional[str]]) -> Optional[str]:
+        """Return cached text, running extract() and caching its result on a miss"""
+        text = self.get(digest)
+        if text is None:
+            text = extract()
+            # Failed extractions are not cached so they are retried next time
+            if text:
+                self.put(digest, text)
+        return text
+    
+    def put(self, digest: str, text: str):
+        """Store extracted text in both tiers"""
+        self._remember(digest, text)
+        
+        if not self._disk_available():
+            return
+        
+        # Write to a temp file first so other processes never read a partial entry
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(text)
+                f.flush()
+                size = os.fstat(f.fileno()).st_size
+            os.replace(tmp_path, self._path(digest))
+        except OSError:
+            return
+        
+        # Only walk the directory when the running total says it may be over the limit
+        with self._lock:
+            self._puts_since_scan += 1
+            if self._disk_bytes is not None:
+                self._disk_bytes += size
+            needs_scan = (
+                self._disk_bytes is None
+                or self._disk_bytes > self.max_disk_bytes
+                or self._puts_since_scan >= self.rescan_every
+            )
+        
+        if needs_scan:
+            try:
+                self._prune_disk()
+            except OSError:
+                pass
+    
+    def _remember(self, digest: str, text: str):
+        with self._lock:
+            self._memory[digest] = text
+            self._memory.move_to_end(digest)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+    
+    def _prune_disk(self):
+        """Drop expired entries and stale temp files, then evict the least recently used entries over the size limit"""
+        entries = []
+        total = 0
+        now = time.time()
+        expired_before = now - self.max_age_seconds
+        stale_before = now - STALE_TMP_SECONDS
+        for entry in os.scandir(self.cache_dir):
+            try:
+                stat = entry.stat()
+                if entry.name.endswith(".txt"):
+                    if stat.st_mtime < expired_before:
+                        os.remove(entry.path)
+                        continue
+                    entries.append((stat.st_atime, stat.st_size, entry.path))
+                    total += stat.st_size
+                elif entry.name.endswith(".tmp") and stat.st_mtime < stale_before:
+                    os.remove(entry.path)
+            except OSError:
+                continue
+        
+        if total > self.max_disk_bytes:
+            for _, size, path in sorted(entries):
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                if total <= self.max_disk_bytes:
+                    break
+        
+        with self._lock:
+            self._disk_bytes = total
+            self._puts_since_scan = 0
+
+# Shared instance used by the app and the batch workers
+text_cache = TextCache()